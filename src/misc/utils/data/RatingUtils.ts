@@ -6,6 +6,9 @@ let difficultyCache: {
   special: Set<string>;
   map: Map<string, any>;
   nameMap: Map<string, any>;
+  /** PGU rows (from nameMap) and their sortOrders, for snapping ratings to the ladder. */
+  pguList: any[];
+  pguSortOrders: Set<number>;
 } | null = null;
 
 let difficultyCacheTimeout: NodeJS.Timeout | null = null;
@@ -29,12 +32,17 @@ export async function getDifficulties(transaction: any) {
 
     setDifficultyCacheTimeout();
 
+    const nameMap = new Map(difficulties.map(d => [d.name, d]));
+    const pguList = Array.from(nameMap.values()).filter(d => d.type === 'PGU');
+
     difficultyCache = {
       special: new Set(
         difficulties.filter(d => d.type === 'SPECIAL').map(d => d.name),
       ),
       map: new Map(difficulties.map(d => [d.id.toString(), d])),
-      nameMap: new Map(difficulties.map(d => [d.name, d])),
+      nameMap,
+      pguList,
+      pguSortOrders: new Set(pguList.map(d => d.sortOrder as number)),
     };
   }
   return difficultyCache;
@@ -211,20 +219,15 @@ function comparePguByDistanceToSortOrder(a: any, b: any, targetSortOrder: number
   return b.sortOrder - a.sortOrder;
 }
 
-function pickClosestPguDifficulty(difficultyMap: Map<string, any>, targetSortOrder: number): any | null {
-  const list = Array.from(difficultyMap.values())
-    .filter((d: any) => d.type === 'PGU')
-    .sort((a, b) => comparePguByDistanceToSortOrder(a, b, targetSortOrder));
-  return list[0] ?? null;
-}
-
-/** Set of sortOrder values that exist on at least one PGU difficulty row. */
-function buildValidPguSortOrderSet(difficultyMap: Map<string, any>): Set<number> {
-  return new Set(
-    Array.from(difficultyMap.values())
-      .filter((d: any) => d.type === 'PGU')
-      .map((d: any) => d.sortOrder as number),
-  );
+/** Single pass over the cached PGU rows; first row wins exact ties, as the old stable sort did. */
+function pickClosestPguDifficulty(pguList: any[], targetSortOrder: number): any | null {
+  let closest: any | null = null;
+  for (const d of pguList) {
+    if (!closest || comparePguByDistanceToSortOrder(d, closest, targetSortOrder) < 0) {
+      closest = d;
+    }
+  }
+  return closest;
 }
 
 /**
@@ -282,8 +285,11 @@ async function getRatingPguNumericAndSpecials(
     return {specialRatings: [], pguNumeric: null};
   }
 
-  const {special: specialDifficulties, nameMap: difficultyMap} = await getDifficulties(transaction);
-  const validPguSortOrders = buildValidPguSortOrderSet(difficultyMap);
+  const {
+    special: specialDifficulties,
+    nameMap: difficultyMap,
+    pguSortOrders: validPguSortOrders,
+  } = await getDifficulties(transaction);
   const parts = parseRatingRange(rating.trim(), specialDifficulties);
   const specialRatings = [...new Set(collectSpecialsFromParts(parts, specialDifficulties))];
 
@@ -381,14 +387,14 @@ export async function normalizeRating(
     return {specialRatings: []};
   }
 
-  const {nameMap: difficultyMap} = await getDifficulties(transaction);
+  const {pguList} = await getDifficulties(transaction);
   const {specialRatings, pguNumeric} = await getRatingPguNumericAndSpecials(rating, transaction);
 
   if (pguNumeric === null) {
     return {specialRatings};
   }
 
-  const closest = pickClosestPguDifficulty(difficultyMap, pguNumeric);
+  const closest = pickClosestPguDifficulty(pguList, pguNumeric);
   return {
     pguRating: closest?.name,
     specialRatings,
@@ -401,7 +407,7 @@ export async function calculateAverageRating(
   transaction: any,
   isCommunity = false,
 ) {
-  const {nameMap: difficultyMap} = await getDifficulties(transaction);
+  const {nameMap: difficultyMap, pguList} = await getDifficulties(transaction);
   const details = detailObject
     .filter(d => d.isCommunityRating === isCommunity)
     .map((d: any) => d.dataValues);
@@ -454,7 +460,7 @@ export async function calculateAverageRating(
   if (pguNumericVoteCount > 0) {
     const weightedAvgSortOrder = pguNumericSum / pguNumericVoteCount;
 
-    const closest = pickClosestPguDifficulty(difficultyMap, weightedAvgSortOrder);
+    const closest = pickClosestPguDifficulty(pguList, weightedAvgSortOrder);
     if (closest) {
       return closest;
     }
@@ -1,5 +1,3 @@
-import {PassSubmissionJudgements} from '@/models/submissions/PassSubmission.js';
-
 export interface IJudgements {
   earlyDouble: number;
   earlySingle: number;
@@ -28,21 +26,18 @@ export function tilecount(inp: IJudgements): number {
   );
 }
 
-export function calcAcc(inp: IJudgements | PassSubmissionJudgements): number {
-  // Handle array format (from client)
+/** Plain judgement counts only — model instances unwrap their dataValues at the call site. */
+export function calcAcc(inp: IJudgements): number {
   if (!inp) return 0;
 
-  const judgements =
-    inp instanceof PassSubmissionJudgements ? inp.dataValues : inp;
-
-  const total = sumJudgements(judgements);
+  const total = sumJudgements(inp);
   if (!total) return 0;
 
   return (
-    (judgements.perfect + // perfect
-      (judgements.ePerfect + judgements.lPerfect) * 0.75 + // ePerfect + lPerfect
-      (judgements.earlySingle + judgements.lateSingle) * 0.4 + // earlySingle + lateSingle
-      (judgements.earlyDouble + judgements.lateDouble) * 0.2) / // earlyDouble + lateDouble
+    (inp.perfect + // perfect
+      (inp.ePerfect + inp.lPerfect) * 0.75 + // ePerfect + lPerfect
+      (inp.earlySingle + inp.lateSingle) * 0.4 + // earlySingle + lateSingle
+      (inp.earlyDouble + inp.lateDouble) * 0.2) / // earlyDouble + lateDouble
     total
   );
 }
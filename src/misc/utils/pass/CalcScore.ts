@@ -3,6 +3,7 @@ import {calcAcc, IJudgements, tilecount} from './CalcAcc.js';
 import {
   xaccMultiplier as xaccCurveMultiplier,
   type XaccCurveConfig,
+  XACC_CURVE_DEFAULTS,
   resolveXaccCurveForLevelData,
 } from './scoreV2XaccCurve.js';
 
@@ -16,17 +17,9 @@ const pwr = 0.7;
 /** Applied when miss count is zero (matches plotted zero-miss ScoreV2 curve). */
 export const SCORE_V2_ZERO_MISS_MULTIPLIER = 1.1;
 
-export const getScoreV2Mtp = (inputs: IJudgements) => {
-  const misses = inputs.earlyDouble;
-
-  const tiles = tilecount(inputs);
-
-  if (!misses) {
-    return SCORE_V2_ZERO_MISS_MULTIPLIER;
-  }
+const missMtpForAdjustedMisses = (am: number) => {
   const tp = (start + end) / 2;
   const tpDeduc = (startDeduc + endDeduc) / 2;
-  const am = Math.max(0, misses - Math.floor(tiles / gmConst));
   if (am === 0) {
     return 1;
   } else if (am <= start) {
@@ -46,6 +39,26 @@ export const getScoreV2Mtp = (inputs: IJudgements) => {
   }
 };
 
+/** Judgement counts are integers, so 0..end covers every curved multiplier. */
+const MISS_MTP_TABLE = Array.from({length: end + 1}, (_, am) =>
+  missMtpForAdjustedMisses(am),
+);
+
+export const getScoreV2Mtp = (inputs: IJudgements) => {
+  const misses = inputs.earlyDouble;
+
+  const tiles = tilecount(inputs);
+
+  if (!misses) {
+    return SCORE_V2_ZERO_MISS_MULTIPLIER;
+  }
+  const am = Math.max(0, misses - Math.floor(tiles / gmConst));
+  if (Number.isInteger(am) && am <= end) {
+    return MISS_MTP_TABLE[am];
+  }
+  return missMtpForAdjustedMisses(am);
+};
+
 /** Miss-debuff multiplier for a miss count and hit-tile count (zero misses → 1.1). */
 export function scoreV2MtpFromMisses(misses: number, hitTiles: number): number {
   const m = Math.max(0, Math.floor(Number(misses)) || 0);
@@ -64,15 +77,6 @@ export function scoreV2MtpFromMisses(misses: number, hitTiles: number): number {
   });
 }
 
-const getXaccMtp = (
-  inp: IJudgements,
-  baseScore: number,
-  curveOverrides?: XaccCurveConfig | null,
-) => {
-  const xacc = calcAcc(inp);
-  return xaccCurveMultiplier(xacc, baseScore, curveOverrides);
-};
-
 /** Standard speed multiplier (Marathon / desync-bus branch removed). */
 export const getSpeedMtp = (speed: number) => {
   if (!speed || speed === 1) {
@@ -128,8 +132,8 @@ const getScore = (passData: PassData, levelData: LevelData) => {
   const inputs = passData.judgements;
   const accuracy = calcAcc(inputs);
   const base = resolveScoreBase(levelData, accuracy);
-  const xaccMtp = getXaccMtp(
-    inputs,
+  const xaccMtp = xaccCurveMultiplier(
+    accuracy,
     base,
     resolveXaccCurveForLevelData(levelData),
   );
@@ -149,12 +153,28 @@ export interface LevelData {
   xaccCurve?: XaccCurveConfig | null;
 }
 
+/**
+ * Resolve level-invariant scoring inputs (xacc curve) once so bulk callers can
+ * score many passes on the same level without re-parsing curve metadata per pass.
+ */
+export function prepareScoreV2Level(levelData: LevelData): LevelData {
+  return {
+    ...levelData,
+    xaccCurve: resolveXaccCurveForLevelData(levelData) ?? XACC_CURVE_DEFAULTS,
+  };
+}
+
 interface PassData {
   speed: number;
   judgements: IJudgements;
   isNoHoldTap: boolean;
 }
 
+// Type guard to determine which type we're dealing with
+const isPassSubmission = (
+  input: PassData | IPassSubmission,
+): input is IPassSubmission => 'judgements' in input && 'flags' in input;
+
 // Declare the overloads
 export function getScoreV2(passData: PassData, levelData: LevelData): number;
 export function getScoreV2(
@@ -166,11 +186,6 @@ export function getScoreV2(
   input: PassData | IPassSubmission,
   levelData: LevelData,
 ): number {
-  // Type guard to determine which type we're dealing with
-  const isPassSubmission = (
-    input: PassData | IPassSubmission,
-  ): input is IPassSubmission => 'judgements' in input && 'flags' in input;
-
   if (isPassSubmission(input)) {
     const inputs: IJudgements = input.judgements || {
       earlyDouble: 0,
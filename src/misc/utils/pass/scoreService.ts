@@ -4,7 +4,7 @@
  */
 import {logger} from '@/server/services/core/LoggerService.js';
 import {calcAcc, type IJudgements, sumJudgements} from './CalcAcc.js';
-import {getScoreV2} from './CalcScore.js';
+import {getScoreV2, prepareScoreV2Level} from './CalcScore.js';
 import {sanitizeJudgements} from './SanitizeJudgements.js';
 
 export type LevelScoreContext = {
@@ -184,14 +184,8 @@ export function computePassScoreV2(
 
   logScoreGaps('computePassScoreV2', normalized.warnings, levelContext, normalized);
 
-  const scoreV2 = getScoreV2(
-    {
-      speed: normalized.speed,
-      judgements: normalized.judgements,
-      isNoHoldTap: normalized.isNoHoldTap,
-    },
-    levelContext,
-  );
+  // NormalizedPass already carries speed/judgements/isNoHoldTap — no wrapper needed.
+  const scoreV2 = getScoreV2(normalized, levelContext);
 
   return assertFiniteScoreResult({scoreV2, accuracy});
 }
@@ -201,6 +195,7 @@ export function computePassScoreV2Batch(
   passes: PassScoreInput[],
   levelContext: LevelScoreContext,
 ): PassScoreResult[] {
+  const scoringLevel = prepareScoreV2Level(levelContext);
   return passes.map((pass, index) => {
     const normalized = normalizePassScoreInput(pass);
     const accuracy = calcAcc(normalized.judgements);
@@ -216,14 +211,7 @@ export function computePassScoreV2Batch(
       normalized,
     );
 
-    const scoreV2 = getScoreV2(
-      {
-        speed: normalized.speed,
-        judgements: normalized.judgements,
-        isNoHoldTap: normalized.isNoHoldTap,
-      },
-      levelContext,
-    );
+    const scoreV2 = getScoreV2(normalized, scoringLevel);
     return assertFiniteScoreResult({scoreV2, accuracy});
   });
 }
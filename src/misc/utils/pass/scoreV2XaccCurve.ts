@@ -78,20 +78,43 @@ export function pickLevelXaccCurve(
   };
 }
 
-export function parseXaccCurveMeta(
-  raw: unknown,
-): { poleOffset?: number; topMultiplier?: number; pins?: unknown } | null {
-  if (!raw) return null;
-  let obj: unknown = raw;
-  if (typeof obj === 'string') {
-    try {
-      obj = JSON.parse(obj);
-    } catch {
-      return null;
-    }
+type XaccCurveMeta = { poleOffset?: number; topMultiplier?: number; pins?: unknown };
+
+/** Bounded memo of parsed string metadata; levels rescoring many passes hit the same few strings. */
+const XACC_CURVE_META_CACHE_MAX = 1024;
+const parsedXaccCurveMetaCache = new Map<string, XaccCurveMeta | null>();
+
+function parseXaccCurveMetaString(raw: string): XaccCurveMeta | null {
+  const cached = parsedXaccCurveMetaCache.get(raw);
+  if (cached !== undefined) {
+    // Refresh recency so hot levels survive eviction.
+    parsedXaccCurveMetaCache.delete(raw);
+    parsedXaccCurveMetaCache.set(raw, cached);
+    return cached;
+  }
+
+  let parsed: XaccCurveMeta | null = null;
+  try {
+    const obj: unknown = JSON.parse(raw);
+    if (obj && typeof obj === 'object') parsed = obj as any;
+  } catch {
+    parsed = null;
   }
-  if (!obj || typeof obj !== 'object') return null;
-  return obj as any;
+
+  if (parsedXaccCurveMetaCache.size >= XACC_CURVE_META_CACHE_MAX) {
+    const oldest = parsedXaccCurveMetaCache.keys().next().value;
+    if (oldest !== undefined) parsedXaccCurveMetaCache.delete(oldest);
+  }
+  parsedXaccCurveMetaCache.set(raw, parsed);
+  return parsed;
+}
+
+/** Parsed metadata may be shared between callers — treat it as read-only. */
+export function parseXaccCurveMeta(raw: unknown): XaccCurveMeta | null {
+  if (!raw) return null;
+  if (typeof raw === 'string') return parseXaccCurveMetaString(raw);
+  if (typeof raw !== 'object') return null;
+  return raw as any;
 }
 
 export function resolveXaccCurveForLevelData(
@@ -102,11 +125,15 @@ export function resolveXaccCurveForLevelData(
   return pickLevelXaccCurve(levelData);
 }
 
+/** Shared resolved config for levels without curve overrides (read-only). */
+const DEFAULT_XACC_CURVE_CONFIG: Readonly<Required<XaccCurveConfig>> =
+  Object.freeze({ ...XACC_CURVE_DEFAULTS });
+
 export function resolveXaccCurveConfig(
   overrides?: XaccCurveConfig | null,
 ): Required<XaccCurveConfig> {
-  if (!overrides) {
-    return { ...XACC_CURVE_DEFAULTS };
+  if (!overrides || overrides === XACC_CURVE_DEFAULTS) {
+    return DEFAULT_XACC_CURVE_CONFIG;
   }
   return {
     cutoff: overrides.cutoff ?? XACC_CURVE_DEFAULTS.cutoff,
@@ -115,13 +142,17 @@ export function resolveXaccCurveConfig(
   };
 }
 
-export function xaccHyperbolaCoefficients(cfg: Required<XaccCurveConfig>): {
+type XaccHyperbolaCoefficients = {
   A: number;
   B: number;
   span: number;
   G: number;
   E: number;
-} {
+};
+
+function computeXaccHyperbolaCoefficients(
+  cfg: Required<XaccCurveConfig>,
+): XaccHyperbolaCoefficients {
   const span = 1 - cfg.cutoff;
   const G = cfg.topMultiplier;
   const E = cfg.poleOffset;
@@ -130,6 +161,19 @@ export function xaccHyperbolaCoefficients(cfg: Required<XaccCurveConfig>): {
   return { A, B, span, G, E };
 }
 
+const DEFAULT_XACC_HYPERBOLA: Readonly<XaccHyperbolaCoefficients> = Object.freeze(
+  computeXaccHyperbolaCoefficients(DEFAULT_XACC_CURVE_CONFIG),
+);
+
+export function xaccHyperbolaCoefficients(
+  cfg: Required<XaccCurveConfig>,
+): XaccHyperbolaCoefficients {
+  if (cfg === DEFAULT_XACC_CURVE_CONFIG) {
+    return DEFAULT_XACC_HYPERBOLA;
+  }
+  return computeXaccHyperbolaCoefficients(cfg);
+}
+
 /** Unit shape u(t) in [0, 1], with u(0)=0 and u(1)=1. */
 export function xaccUnitShape(t: number, cfg: Required<XaccCurveConfig>): number {
   const { A, B, span, G, E } = xaccHyperbolaCoefficients(cfg);
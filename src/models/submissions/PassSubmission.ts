@@ -208,7 +208,7 @@ PassSubmissionJudgements.init(
     accuracy: {
       type: DataTypes.VIRTUAL,
       get() {
-        return calcAcc(this);
+        return calcAcc(this.dataValues);
       },
     },
   },
@@ -31,25 +31,29 @@ const SLOW_LOG_EXCLUDED_ROUTES = [
   '/v2/media/player-avatar/*'
 ];
 
+const SLOW_LOG_EXCLUDED_ROUTE_PATTERNS = SLOW_LOG_EXCLUDED_ROUTES.map((pattern) => {
+  const escapedPattern = pattern
+    .replace(/\*/g, '__WILDCARD__')
+    .replace(/[.+?^${}()|[\]\\]/g, '\\$&')
+    .replace(/__WILDCARD__/g, '.*');
+  return new RegExp(`^${escapedPattern}$`);
+});
+
 function isExcludedRoute(path: string): boolean {
-  return SLOW_LOG_EXCLUDED_ROUTES.some((pattern) => {
-    const escapedPattern = pattern
-      .replace(/\*/g, '__WILDCARD__')
-      .replace(/[.+?^${}()|[\]\\]/g, '\\$&')
-      .replace(/__WILDCARD__/g, '.*');
-    const regex = new RegExp(`^${escapedPattern}$`);
-    return regex.test(path);
-  });
+  return SLOW_LOG_EXCLUDED_ROUTE_PATTERNS.some((regex) => regex.test(path));
 }
 
 export function slowEndpointLoggingMiddleware(req: Request, res: Response, next: NextFunction): void {
   const start = process.hrtime.bigint();
-  const path = req.originalUrl.split('?')[0];
-  const route = `${req.method} ${path}`;
-
   res.on('finish', () => {
     const durationMs = Number(process.hrtime.bigint() - start) / 1_000_000;
-    if (durationMs > SLOW_ENDPOINT_THRESHOLD_MS && !isExcludedRoute(path)) {
+    // Negated `>` so a NaN threshold (e.g. env set to `off`) still logs nothing.
+    if (!(durationMs > SLOW_ENDPOINT_THRESHOLD_MS)) return;
+
+    // Only resolve the route for requests that are actually slow
+    const path = req.originalUrl.split('?')[0];
+    if (!isExcludedRoute(path)) {
+      const route = `${req.method} ${path}`;
       logger.warn(`Slow endpoint (${durationMs.toFixed(0)}ms): ${route}`, {
         status: res.statusCode,
         duration: Math.round(durationMs),
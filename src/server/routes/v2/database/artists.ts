@@ -172,11 +172,12 @@ router.get(
         attributes: ['id'],
         order
       });
-      const filteredIds = filteredArtists.map(a => a.id);
+      const filteredIds = new Set(filteredArtists.map(a => a.id));
+      const exactIdSet = new Set(exactMatchIds);
 
       // Maintain order: exact matches first, then partial matches
-      const filteredExactIds = exactMatchIds.filter(id => filteredIds.includes(id));
-      const filteredPartialIds = allMatchingIds.filter(id => !exactMatchIds.includes(id) && filteredIds.includes(id));
+      const filteredExactIds = exactMatchIds.filter(id => filteredIds.has(id));
+      const filteredPartialIds = allMatchingIds.filter(id => !exactIdSet.has(id) && filteredIds.has(id));
       allMatchingIds = [...filteredExactIds, ...filteredPartialIds];
     }
 
@@ -237,16 +238,19 @@ router.get(
     // Step 5: Sort results to maintain exact matches first (if we had a search)
     let sortedRows = rows;
     if (searchString && exactMatchIds.length > 0 && paginatedIds.length > 0) {
+      // Build sort keys once instead of scanning id arrays on every comparison
+      const exactIdSet = new Set(exactMatchIds);
+      const pageIndexById = new Map(paginatedIds.map((id, index) => [id, index]));
       sortedRows = rows.sort((a, b) => {
-        const aIsExact = exactMatchIds.includes(a.id);
-        const bIsExact = exactMatchIds.includes(b.id);
+        const aIsExact = exactIdSet.has(a.id);
+        const bIsExact = exactIdSet.has(b.id);
 
         if (aIsExact && !bIsExact) return -1;
         if (!aIsExact && bIsExact) return 1;
 
         // Both in same category - maintain order from paginatedIds
-        const aIndex = paginatedIds.indexOf(a.id);
-        const bIndex = paginatedIds.indexOf(b.id);
+        const aIndex = pageIndexById.get(a.id) ?? -1;
+        const bIndex = pageIndexById.get(b.id) ?? -1;
         return aIndex - bIndex;
       });
     }
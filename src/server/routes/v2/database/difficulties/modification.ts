@@ -17,7 +17,10 @@ import {
 import sequelize from '@/config/db.js';
 import { getIO } from '@/misc/utils/server/socket.js';
 import { sseManager } from '@/misc/utils/server/sse.js';
-import { computePassScoreV2 } from '@/misc/utils/pass/scoreService.js';
+import {
+  buildLevelScoreContext,
+  computePassScoreV2Batch,
+} from '@/misc/utils/pass/scoreService.js';
 import { safeTransactionRollback, getFileIdFromCdnUrl, isCdnUrl } from '@/misc/utils/Utility.js';
 import ElasticsearchService from '@/server/services/elasticsearch/ElasticsearchService.js';
 import { logger } from '@/server/services/core/LoggerService.js';
@@ -534,19 +537,25 @@ router.put(
         const levelIds = levels.map(level => level.id);
 
         if (levelIds.length > 0) {
-          const levelDataMap = new Map(
-            levels.map(level => [level.id, {
-              baseScore: level.baseScore,
-              ppBaseScore: level.ppBaseScore,
-              xaccCurveMeta: level.xaccCurveMeta ?? null,
-            }]),
-          );
-
           const updatedDifficulty = {
             name: updateData.name as string,
             baseScore: updateData.baseScore as number,
           };
 
+          // One scoring context per level, shared by all of that level's passes
+          const levelContextMap = new Map(
+            levels.map(level => [level.id, buildLevelScoreContext(
+              {
+                baseScore: level.baseScore,
+                ppBaseScore: level.ppBaseScore,
+                xaccCurveMeta: level.xaccCurveMeta ?? null,
+              },
+              {
+                difficulty: updatedDifficulty,
+              },
+            )]),
+          );
+
           const affectedPasses = await Pass.findAll({
             attributes: ['id', 'speed', 'isNoHoldTap', 'playerId', 'levelId', 'scoreV2'],
             where: {
@@ -562,31 +571,38 @@ router.put(
             transaction,
           });
 
-          const scoreUpdates: { id: number; scoreV2: number }[] = [];
-
+          const passesByLevel = new Map<number, Pass[]>();
           for (const pass of affectedPasses) {
             if (!pass.judgements) continue;
+            if (!levelContextMap.has(pass.levelId)) continue;
+
+            const levelPasses = passesByLevel.get(pass.levelId);
+            if (levelPasses) {
+              levelPasses.push(pass);
+            } else {
+              passesByLevel.set(pass.levelId, [pass]);
+            }
+          }
 
-            const level = levelDataMap.get(pass.levelId);
-            if (!level) continue;
+          const scoreUpdates: { id: number; scoreV2: number }[] = [];
 
-            const {scoreV2: newScore} = computePassScoreV2(
-              {
+          for (const [levelId, levelPasses] of passesByLevel) {
+            const scores = computePassScoreV2Batch(
+              levelPasses.map(pass => ({
                 speed: pass.speed || 1.0,
                 judgements: pass.judgements,
                 isNoHoldTap: pass.isNoHoldTap || false,
-              },
-              level,
-              {
-                difficulty: updatedDifficulty,
-              },
+              })),
+              levelContextMap.get(levelId)!,
             );
 
-            scoreUpdates.push({ id: pass.id, scoreV2: newScore });
+            levelPasses.forEach((pass, index) => {
+              scoreUpdates.push({ id: pass.id, scoreV2: scores[index].scoreV2 });
 
-            if (pass.playerId) {
-              affectedPlayerIds.add(pass.playerId);
-            }
+              if (pass.playerId) {
+                affectedPlayerIds.add(pass.playerId);
+              }
+            });
           }
 
           // Batch with CASE/WHEN — one query per chunk, beats N individual
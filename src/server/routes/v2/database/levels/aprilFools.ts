@@ -14,7 +14,7 @@ import { PlayerStatsService } from '@/server/services/core/PlayerStatsService.js
 import ElasticsearchService from '@/server/services/elasticsearch/ElasticsearchService.js';
 import {
   buildLevelScoreContext,
-  computePassScoreV2,
+  computePassScoreV2Batch,
 } from '@/misc/utils/pass/scoreService.js';
 
 const playerStatsService = PlayerStatsService.getInstance();
@@ -73,20 +73,21 @@ const handlePassUpdates = async (levelId: number, diffId: number, baseScore: num
       // Process passes in batches
       const batchSize = 100;
       for (let i = 0; i < passes.length; i += batchSize) {
-        const batch = passes.slice(i, i + batchSize);
+        const batch = passes
+          .slice(i, i + batchSize)
+          .map(passData => passData.dataValues)
+          .filter(pass => pass.judgements);
+        const scores = computePassScoreV2Batch(
+          batch.map(pass => ({
+            speed: pass.speed || 1,
+            judgements: pass.judgements,
+            isNoHoldTap: pass.isNoHoldTap || false,
+          })),
+          levelContext,
+        );
         await Promise.all(
-          batch.map(async passData => {
-            const pass = passData.dataValues;
-            if (!pass.judgements) return;
-
-            const {accuracy, scoreV2} = computePassScoreV2(
-              {
-                speed: pass.speed || 1,
-                judgements: pass.judgements,
-                isNoHoldTap: pass.isNoHoldTap || false,
-              },
-              levelContext,
-            );
+          batch.map(async (pass, index) => {
+            const {accuracy, scoreV2} = scores[index];
 
             await Pass.update(
               { accuracy, scoreV2 },
@@ -11,7 +11,7 @@ import Pass from '@/models/passes/Pass.js';
 import Judgement from '@/models/passes/Judgement.js';
 import {
   buildLevelScoreContext,
-  computePassScoreV2,
+  computePassScoreV2Batch,
 } from '@/misc/utils/pass/scoreService.js';
 import {PlayerStatsService} from '@/server/services/core/PlayerStatsService.js';
 import {sseManager} from '@/misc/utils/server/sse.js';
@@ -349,18 +349,21 @@ const handleScoreRecalculations = async (
     scoreV2: number;
   }> = [];
 
-  for (const passData of passes) {
-    const pass = passData.dataValues;
-    if (!pass.judgements) continue;
+  const scoredPasses = passes
+    .map(passData => passData.dataValues)
+    .filter(pass => pass.judgements);
+  const scores = computePassScoreV2Batch(
+    scoredPasses.map(pass => ({
+      speed: pass.speed || 1,
+      judgements: pass.judgements,
+      isNoHoldTap: pass.isNoHoldTap || false,
+    })),
+    levelContext,
+  );
 
-    const {accuracy, scoreV2} = computePassScoreV2(
-      {
-        speed: pass.speed || 1,
-        judgements: pass.judgements,
-        isNoHoldTap: pass.isNoHoldTap || false,
-      },
-      levelContext,
-    );
+  for (let i = 0; i < scoredPasses.length; i++) {
+    const pass = scoredPasses[i];
+    const {accuracy, scoreV2} = scores[i];
 
     logger.debug(`Pass ${pass.id} scoreV2: ${scoreV2}`);
     passUpdates.push({
@@ -261,10 +261,12 @@ router.get(
 
     // Apply artist filter to search results if both are present
     if (artistSongIds !== null && allMatchingIds.length > 0) {
-      allMatchingIds = allMatchingIds.filter(id => artistSongIds!.includes(id));
+      const artistSongIdSet = new Set(artistSongIds);
+      const exactIdSet = new Set(exactMatchIds);
+      allMatchingIds = allMatchingIds.filter(id => artistSongIdSet.has(id));
       // Maintain order: exact matches first, then partial matches
-      const filteredExactIds = exactMatchIds.filter(id => artistSongIds!.includes(id));
-      const filteredPartialIds = allMatchingIds.filter(id => !exactMatchIds.includes(id));
+      const filteredExactIds = exactMatchIds.filter(id => artistSongIdSet.has(id));
+      const filteredPartialIds = allMatchingIds.filter(id => !exactIdSet.has(id));
       allMatchingIds = [...filteredExactIds, ...filteredPartialIds];
     } else if (artistSongIds !== null && allMatchingIds.length === 0) {
       // No search but artist filter exists
@@ -343,8 +345,9 @@ router.get(
 
       // Apply filter to existing results
       if (allMatchingIds.length > 0) {
-        allMatchingIds = allMatchingIds.filter(id => filteredByArtistCount.includes(id));
-        exactMatchIds = exactMatchIds.filter(id => filteredByArtistCount.includes(id));
+        const artistCountIdSet = new Set(filteredByArtistCount);
+        allMatchingIds = allMatchingIds.filter(id => artistCountIdSet.has(id));
+        exactMatchIds = exactMatchIds.filter(id => artistCountIdSet.has(id));
       } else {
         // No search string, just filter by artist count
         // Sort the filtered results according to the order clause
@@ -372,11 +375,12 @@ router.get(
         attributes: ['id'],
         order
       });
-      const filteredIds = filteredSongs.map(s => s.id);
+      const filteredIds = new Set(filteredSongs.map(s => s.id));
+      const exactIdSet = new Set(exactMatchIds);
 
       // Maintain order: exact matches first, then partial matches
-      const filteredExactIds = exactMatchIds.filter(id => filteredIds.includes(id));
-      const filteredPartialIds = allMatchingIds.filter(id => !exactMatchIds.includes(id) && filteredIds.includes(id));
+      const filteredExactIds = exactMatchIds.filter(id => filteredIds.has(id));
+      const filteredPartialIds = allMatchingIds.filter(id => !exactIdSet.has(id) && filteredIds.has(id));
       allMatchingIds = [...filteredExactIds, ...filteredPartialIds];
     }
 
@@ -454,16 +458,19 @@ router.get(
     // Step 5: Sort results to maintain exact matches first (if we had a search)
     let sortedRows = rows;
     if (searchString && exactMatchIds.length > 0 && paginatedIds.length > 0) {
+      // Build sort keys once instead of scanning id arrays on every comparison
+      const exactIdSet = new Set(exactMatchIds);
+      const pageIndexById = new Map(paginatedIds.map((id, index) => [id, index]));
       sortedRows = rows.sort((a, b) => {
-        const aIsExact = exactMatchIds.includes(a.id);
-        const bIsExact = exactMatchIds.includes(b.id);
+        const aIsExact = exactIdSet.has(a.id);
+        const bIsExact = exactIdSet.has(b.id);
 
         if (aIsExact && !bIsExact) return -1;
         if (!aIsExact && bIsExact) return 1;
 
         // Both in same category - maintain order from paginatedIds
-        const aIndex = paginatedIds.indexOf(a.id);
-        const bIndex = paginatedIds.indexOf(b.id);
+        const aIndex = pageIndexById.get(a.id) ?? -1;
+        const bIndex = pageIndexById.get(b.id) ?? -1;
         return aIndex - bIndex;
       });
     }
@@ -24,9 +24,10 @@ import {
 import { buildTufStellarAccessSegmentsForUser } from '@/server/services/billing/tufStellarAccessSegments.js';
 import { addCalendarMonthsUtc } from '@/misc/utils/time/addCalendarMonthsUtc.js';
 import {
-  describeProductFromStripeWebhookRawBody,
-  describeProductFromXsollaWebhookRawBody,
-  describeProductFromAdminGrantRawBody,
+  describeProductFromStripeWebhookPayload,
+  describeProductFromXsollaWebhookPayload,
+  describeProductFromAdminGrantPayload,
+  parseBillingEventRawBody,
 } from '@/server/services/billing/tufStellarBillingEventProduct.js';
 import { isTufStellarFeatureEnabled, stripeConfig } from '@/config/app.config.js';
 import ElasticsearchService from '@/server/services/elasticsearch/ElasticsearchService.js';
@@ -103,9 +104,9 @@ interface PaymentSummary {
   currency: string | null;
 }
 
-function summarizeRawBody(rawBody: string): PaymentSummary {
+function summarizePayload(payload: Record<string, unknown> | null): PaymentSummary {
+  if (!payload) return { amount: null, currency: null };
   try {
-    const payload = JSON.parse(rawBody) as Record<string, unknown>;
     const stripeSummary = summarizeStripeEnvelope(payload);
     if (stripeSummary) return stripeSummary;
 
@@ -194,7 +195,7 @@ const REFERENCE_KIND_ORDER: BillingEventReferenceKind[] = [
  * plus indexed columns on BillingEvent.
  */
 function extractBillingEventReferences(
-  rawBody: string,
+  payload: Record<string, unknown> | null,
   row: { xsollaTransactionId: number | null; xsollaSubscriptionId: number | null; externalId: string | null },
 ): BillingEventReference[] {
   const byKind = new Map<BillingEventReferenceKind, string>();
@@ -205,7 +206,7 @@ function extractBillingEventReferences(
   };
 
   try {
-    const p = JSON.parse(rawBody) as Record<string, any>;
+    const p = payload as Record<string, any> | null;
     if (typeof p?.type === 'string' && p?.data && typeof p.data === 'object') {
       const obj = (p.data as { object?: Record<string, unknown> }).object;
       if (obj && typeof obj === 'object') {
@@ -537,20 +538,22 @@ router.get(
       }
 
       const events = rows.map((r) => {
-        const summary = summarizeRawBody(r.rawBody);
-        const references = extractBillingEventReferences(r.rawBody, {
+        const payload = parseBillingEventRawBody(r.rawBody);
+        const summary = summarizePayload(payload);
+        const references = extractBillingEventReferences(payload, {
           xsollaTransactionId: r.xsollaTransactionId,
           xsollaSubscriptionId: r.xsollaSubscriptionId,
           externalId: r.externalId,
         });
         const activityKind = classifyBillingActivityKind(r, viewerId);
-        const product =
-          r.provider === 'stripe'
-            ? describeProductFromStripeWebhookRawBody(r.rawBody)
+        const product = !payload
+          ? null
+          : r.provider === 'stripe'
+            ? describeProductFromStripeWebhookPayload(payload)
             : r.provider === 'xsolla'
-              ? describeProductFromXsollaWebhookRawBody(r.rawBody)
+              ? describeProductFromXsollaWebhookPayload(payload)
               : r.provider === 'admin'
-                ? describeProductFromAdminGrantRawBody(r.rawBody)
+                ? describeProductFromAdminGrantPayload(payload)
                 : null;
 
         let counterpartyUsername: string | null = null;
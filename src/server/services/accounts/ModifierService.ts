@@ -346,6 +346,19 @@ export class ModifierService {
       let transaction: any;
       try {
         transaction = await sequelize.transaction();
+
+        // Load every level once up front instead of once per pass
+        const levelIds = [...new Set(passes.map(pass => pass.levelId))];
+        const levels = await Level.findAll({
+          where: { id: levelIds },
+          include: [{
+            model: Difficulty,
+            as: 'difficulty'
+          }],
+          transaction
+        });
+        const levelsById = new Map(levels.map(level => [level.id, level]));
+
         for (const pass of passes) {
           if (pass.judgements) {
             const currentEarlyDouble = pass.judgements.earlyDouble || 0;
@@ -356,13 +369,7 @@ export class ModifierService {
               }, { transaction });
 
             // Get level data for score recalculation
-            const level = await Level.findByPk(pass.levelId, {
-              include: [{
-                model: Difficulty,
-                as: 'difficulty'
-              }],
-              transaction
-            });
+            const level = levelsById.get(pass.levelId);
 
             if (level) {
               const {accuracy: newAccuracy, scoreV2: newScore} = computePassScoreV2(
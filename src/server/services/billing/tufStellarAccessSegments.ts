@@ -110,12 +110,19 @@ export async function buildTufStellarAccessSegmentsForUser(
   nowMs: number = Date.now(),
 ): Promise<TufStellarAccessSegmentDto[]> {
   const rows = await loadSegmentsForUser(viewerUserId);
-  const active = rows.filter((s) => new Date(s.endsAt).getTime() > nowMs);
-  active.sort((a, b) => new Date(a.startsAt).getTime() - new Date(b.startsAt).getTime());
+  // Parse each segment's bounds once; reused by the filter, sort and DTO build.
+  const active = rows
+    .map((segment) => ({
+      segment,
+      startMs: new Date(segment.startsAt).getTime(),
+      endMs: new Date(segment.endsAt).getTime(),
+    }))
+    .filter(({ endMs }) => endMs > nowMs);
+  active.sort((a, b) => a.startMs - b.startMs);
 
   const eventIds = [
     ...new Set(
-      active.map((s) => s.billingEventId).filter((id): id is number => id != null && Number.isFinite(Number(id))),
+      active.map(({ segment }) => segment.billingEventId).filter((id): id is number => id != null && Number.isFinite(Number(id))),
     ),
   ];
 
@@ -154,9 +161,7 @@ export async function buildTufStellarAccessSegmentsForUser(
 
   const out: TufStellarAccessSegmentDto[] = [];
 
-  for (const s of active) {
-    const startMs = new Date(s.startsAt).getTime();
-    const endMs = new Date(s.endsAt).getTime();
+  for (const { segment: s, startMs, endMs } of active) {
     const rem = remainingMsForSegment(startMs, endMs, nowMs);
 
     const ev = s.billingEventId != null ? eventById.get(Number(s.billingEventId)) : undefined;
@@ -184,8 +189,8 @@ export async function buildTufStellarAccessSegmentsForUser(
     out.push({
       segmentId: Number(s.id),
       months: Number(s.months),
-      startsAt: new Date(s.startsAt).toISOString(),
-      endsAt: new Date(s.endsAt).toISOString(),
+      startsAt: new Date(startMs).toISOString(),
+      endsAt: new Date(endMs).toISOString(),
       remainingMs: rem,
       source,
       giftFrom: resolvedGiftFrom,
@@ -70,19 +70,23 @@ function itemIdFromPurchaseItem(item: Record<string, unknown>): string | null {
   return trimmed(item.id ?? item.item_id ?? item.itemId);
 }
 
-/**
- * Best-effort descriptor for activity/history: maps webhook line items + SKU fields to catalog months (one-time purchases).
- */
-export function describeProductFromXsollaWebhookRawBody(rawBody: string): BillingEventProductDescriptor | null {
-  let payload: Record<string, unknown>;
+/** Parse a billing event `rawBody` once; null unless it is a JSON object. */
+export function parseBillingEventRawBody(rawBody: string): Record<string, unknown> | null {
   try {
     const p = JSON.parse(rawBody) as unknown;
     if (!p || typeof p !== 'object' || Array.isArray(p)) return null;
-    payload = p as Record<string, unknown>;
+    return p as Record<string, unknown>;
   } catch {
     return null;
   }
+}
 
+/**
+ * Best-effort descriptor for activity/history: maps webhook line items + SKU fields to catalog months (one-time purchases).
+ */
+export function describeProductFromXsollaWebhookPayload(
+  payload: Record<string, unknown>,
+): BillingEventProductDescriptor | null {
   const purchaseItem = firstPurchaseItem(payload);
   let sku: string | null = purchaseItem ? skuFromPurchaseItem(purchaseItem) : null;
   const itemId: string | null = purchaseItem ? itemIdFromPurchaseItem(purchaseItem) : null;
@@ -115,51 +119,39 @@ export function describeProductFromXsollaWebhookRawBody(rawBody: string): Billin
   };
 }
 
-/** Parsed product hints from an admin grant billing event `rawBody`. */
-export function describeProductFromAdminGrantRawBody(rawBody: string): BillingEventProductDescriptor | null {
-  try {
-    const p = JSON.parse(rawBody) as unknown;
-    if (!p || typeof p !== 'object' || Array.isArray(p)) return null;
-    const payload = p as Record<string, unknown>;
-    if (payload.type !== 'admin_grant') return null;
-    const durationKind = payload.durationKind;
-    const durationValue = Number(payload.durationValue);
-    if (!Number.isFinite(durationValue) || durationValue <= 0) return null;
-    if (durationKind === 'months') {
-      return {
-        kind: 'admin_grant',
-        months: durationValue,
-        days: null,
-        sku: null,
-        itemId: null,
-      };
-    }
-    if (durationKind === 'days') {
-      return {
-        kind: 'admin_grant',
-        months: null,
-        days: durationValue,
-        sku: null,
-        itemId: null,
-      };
-    }
-    return null;
-  } catch {
-    return null;
+/** Parsed product hints from an admin grant billing event payload. */
+export function describeProductFromAdminGrantPayload(
+  payload: Record<string, unknown>,
+): BillingEventProductDescriptor | null {
+  if (payload.type !== 'admin_grant') return null;
+  const durationKind = payload.durationKind;
+  const durationValue = Number(payload.durationValue);
+  if (!Number.isFinite(durationValue) || durationValue <= 0) return null;
+  if (durationKind === 'months') {
+    return {
+      kind: 'admin_grant',
+      months: durationValue,
+      days: null,
+      sku: null,
+      itemId: null,
+    };
   }
-}
-
-/** Parsed product hints from a Stripe webhook `rawBody` (envelope JSON) for billing activity UI. */
-export function describeProductFromStripeWebhookRawBody(rawBody: string): BillingEventProductDescriptor | null {
-  let payload: Record<string, unknown>;
-  try {
-    const p = JSON.parse(rawBody) as unknown;
-    if (!p || typeof p !== 'object' || Array.isArray(p)) return null;
-    payload = p as Record<string, unknown>;
-  } catch {
-    return null;
+  if (durationKind === 'days') {
+    return {
+      kind: 'admin_grant',
+      months: null,
+      days: durationValue,
+      sku: null,
+      itemId: null,
+    };
   }
+  return null;
+}
 
+/** Parsed product hints from a Stripe webhook payload (envelope JSON) for billing activity UI. */
+export function describeProductFromStripeWebhookPayload(
+  payload: Record<string, unknown>,
+): BillingEventProductDescriptor | null {
   const t = trimmed(payload.type);
   if (t !== 'checkout.session.completed') return null;
 
@@ -1,6 +1,8 @@
 import axios, { AxiosInstance, AxiosError } from 'axios';
 import FormData from 'form-data';
 import fs from 'fs';
+import http from 'http';
+import https from 'https';
 import * as Sentry from '@sentry/node';
 import { logger } from './LoggerService.js';
 import { jobProgressService } from './JobProgressService.js';
@@ -18,6 +20,21 @@ const IGNORED_ERROR_CODES = [
 ];
 const MAX_PACK_GENERATION_TIMEOUT_MS = 60 * 60 * 1000; // 1 hour
 
+/**
+ * Idle keep-alive sockets are closed before the CDN server's keepAliveTimeout (Node default 5s,
+ * not overridden in cdnService/app.ts) so a reused socket is never one the server already dropped.
+ */
+const CDN_AGENT_IDLE_SOCKET_TIMEOUT_MS = 4000;
+
+/** Explicit keep-alive agents: Node >= 19 global agents already do this, the 18.x engine floor does not. */
+const cdnAgentOptions = {
+    keepAlive: true,
+    timeout: CDN_AGENT_IDLE_SOCKET_TIMEOUT_MS,
+    scheduling: 'lifo' as const,
+};
+const cdnHttpAgent = new http.Agent(cdnAgentOptions);
+const cdnHttpsAgent = new https.Agent(cdnAgentOptions);
+
 function envTimeoutMs(name: string, fallback: number): number {
     const raw = process.env[name];
     if (raw === undefined || raw === '') {
@@ -91,6 +108,8 @@ class CdnService {
             baseURL: CDN_BASE_URL,
             /** Default for small CDN API calls; large uploads override `timeout` per request. */
             timeout: 60 * 1000,
+            httpAgent: cdnHttpAgent,
+            httpsAgent: cdnHttpsAgent,
         });
 
         this.client.interceptors.request.use((config) => {
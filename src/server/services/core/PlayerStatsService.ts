@@ -27,6 +27,12 @@ import { getRankedScoreRanksForHits } from '@/server/services/elasticsearch/sear
 
 dotenv.config();
 
+/** Passes counted toward ranked score; impact weights are 0.9^rank (SQL: POW(0.9, rnk - 1)). */
+const TOP_SCORES_COUNT = 20;
+const TOP_SCORE_DECAY_WEIGHTS = Array.from({length: TOP_SCORES_COUNT}, (_, rank) =>
+  Math.pow(0.9, rank),
+);
+
 type EnrichedPlayer = IPlayer & {
   passes: Pass[];
   topScores: {id: number, impact: number}[];
@@ -686,23 +692,29 @@ export class PlayerStatsService {
         const byScoreThenIdDesc = (a: any, b: any) =>
           (b.scoreV2 || 0) - (a.scoreV2 || 0) || (b.id || 0) - (a.id || 0);
 
-        const topScores = Array.from(uniquePasses.values())
-          .filter((pass: any) => !pass.isDeleted && !pass.isDuplicate && isLevelAvailable(pass.level) && !pass.isHidden)
-          .sort(byScoreThenIdDesc)
-          .slice(0, 20)
-          .map((pass, index) => ({
-            id: pass.id,
-            impact: (pass.scoreV2 || 0) * Math.pow(0.9, index),
-          }));
-
-        const potentialTopScores = Array.from(uniquePasses.values())
+        const eligiblePasses = Array.from(uniquePasses.values())
           .filter((pass: any) => !pass.isDeleted && !pass.isDuplicate && !pass.isHidden)
-          .sort(byScoreThenIdDesc)
-          .slice(0, 20)
-          .map((pass, index) => ({
-            id: pass.id,
-            impact: (pass.scoreV2 || 0) * Math.pow(0.9, index),
-          }));
+          .sort(byScoreThenIdDesc);
+
+        // One walk over the sorted list fills both top 20s; topScores additionally
+        // requires the level to be available.
+        const topScores: {id: number, impact: number}[] = [];
+        const potentialTopScores: {id: number, impact: number}[] = [];
+        for (const pass of eligiblePasses) {
+          if (potentialTopScores.length < TOP_SCORES_COUNT) {
+            potentialTopScores.push({
+              id: pass.id,
+              impact: (pass.scoreV2 || 0) * TOP_SCORE_DECAY_WEIGHTS[potentialTopScores.length],
+            });
+          }
+          if (topScores.length < TOP_SCORES_COUNT && isLevelAvailable(pass.level)) {
+            topScores.push({
+              id: pass.id,
+              impact: (pass.scoreV2 || 0) * TOP_SCORE_DECAY_WEIGHTS[topScores.length],
+            });
+          }
+          if (topScores.length >= TOP_SCORES_COUNT && potentialTopScores.length >= TOP_SCORES_COUNT) break;
+        }
 
 
 
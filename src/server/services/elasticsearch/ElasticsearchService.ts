@@ -18,15 +18,16 @@ import { searchLevels as runLevelSearch, searchLevelIds as runSearchLevelIds } f
 import { searchPasses as runPassSearch } from './search/passes/passSearch.js';
 import { searchPlayers as runPlayerSearch, PlayerSearchOptions, PlayerSearchResult } from './search/players/playerSearch.js';
 import { searchCreators as runCreatorSearch, hydrateCreatorUsers, CreatorSearchOptions, CreatorSearchResult } from './search/creators/creatorSearch.js';
-import { ARTIST_REINDEX_DEBOUNCE_MS, BATCH_SIZE, MAX_BATCH_SIZE } from './misc/constants.js';
+import { ARTIST_REINDEX_DEBOUNCE_MS, BATCH_SIZE, MAX_BATCH_SIZE, PLAYER_BULK_CONCURRENCY } from './misc/constants.js';
 import { fetchLevelWithRelations, fetchLevelsForBulkIndex, clearEsIndexRelationCaches } from './fetching/levelFetch.js';
 import { fetchPassWithRelations, fetchPassesForBulkIndex, clearEsPassIndexRelationCaches, invalidateEsLevelCacheForLevelIds } from './fetching/passFetch.js';
-import { fetchPlayersForBulkIndex } from './fetching/playerFetch.js';
+import { fetchPlayersForBulkIndex, PreparedPlayerDocument } from './fetching/playerFetch.js';
 import { fetchCreatorsForBulkIndex } from './fetching/creatorFetch.js';
 import { buildLevelIndexDocument } from './indexing/levelIndexDocument.js';
 import { buildPassIndexDocument } from './indexing/passIndexDocument.js';
 import { decodePuaDeep } from '@/misc/utils/data/searchHelpers.js';
 import { maskStellarPublicEsDoc, maskStellarPublicEsHits } from '@/misc/utils/subscriptions/tufStellarPublicGate.js';
+import { createAsyncPool } from '@/misc/utils/asyncPool.js';
 
 class ElasticsearchService {
   private static instance: ElasticsearchService;
@@ -516,6 +517,26 @@ class ElasticsearchService {
     }
   }
 
+  /**
+   * Write prepared player documents in BATCH_SIZE bulk requests, keeping up to
+   * PLAYER_BULK_CONCURRENCY requests in flight instead of awaiting each in turn.
+   */
+  private async bulkWritePlayerDocuments(docs: PreparedPlayerDocument[]): Promise<void> {
+    const runBulk = createAsyncPool(PLAYER_BULK_CONCURRENCY);
+    const writes: Promise<unknown>[] = [];
+    for (let j = 0; j < docs.length; j += BATCH_SIZE) {
+      const batch = docs.slice(j, j + BATCH_SIZE);
+      const operations = batch.flatMap((doc) => [
+        { index: { _index: playerIndexName, _id: doc.id.toString() } },
+        doc.document,
+      ]);
+      if (operations.length > 0) {
+        writes.push(runBulk(() => client.bulk({ operations, refresh: false })));
+      }
+    }
+    await Promise.all(writes);
+  }
+
   /**
    * Reindex a specific set of players in bulk. Recomputes their stats from
    * `player_pass_summary`, rebuilds documents, and writes them to the players index.
@@ -532,16 +553,7 @@ class ElasticsearchService {
         const docs = await fetchPlayersForBulkIndex(chunk);
         if (docs.length === 0) continue;
 
-        for (let j = 0; j < docs.length; j += BATCH_SIZE) {
-          const batch = docs.slice(j, j + BATCH_SIZE);
-          const operations = batch.flatMap((doc) => [
-            { index: { _index: playerIndexName, _id: doc.id.toString() } },
-            doc.document,
-          ]);
-          if (operations.length > 0) {
-            await client.bulk({ operations, refresh: false });
-          }
-        }
+        await this.bulkWritePlayerDocuments(docs);
         processedCount += docs.length;
       }
       logger.debug(`Reindexed ${processedCount} players (requested ${uniqueIds.length})`);
@@ -588,16 +600,7 @@ class ElasticsearchService {
         if (idList.length === 0) break;
 
         const docs = await fetchPlayersForBulkIndex(idList);
-        for (let j = 0; j < docs.length; j += BATCH_SIZE) {
-          const batch = docs.slice(j, j + BATCH_SIZE);
-          const operations = batch.flatMap((doc) => [
-            { index: { _index: playerIndexName, _id: doc.id.toString() } },
-            doc.document,
-          ]);
-          if (operations.length > 0) {
-            await client.bulk({ operations, refresh: false });
-          }
-        }
+        await this.bulkWritePlayerDocuments(docs);
         processedCount += docs.length;
         logger.debug(`Reindexed ${processedCount} players...`);
 
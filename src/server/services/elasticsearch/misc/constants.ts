@@ -1,6 +1,9 @@
 export const MAX_BATCH_SIZE = 4000;
 export const BATCH_SIZE = 500;
 
+/** Player bulk-index requests kept in flight at once while writing a fetched chunk. */
+export const PLAYER_BULK_CONCURRENCY = 4;
+
 /** Debounce window for batched artist-related level reindexes (ms). */
 export const ARTIST_REINDEX_DEBOUNCE_MS = 30000;
 
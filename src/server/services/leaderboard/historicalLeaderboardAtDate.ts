@@ -223,12 +223,10 @@ export async function hydrateHistoricalLeaderboardPlayers(
 
   return rows.map((row) => {
     const doc = docsById.get(row.playerId);
-    const base: Record<string, unknown> = doc
-      ? { ...doc }
-      : { id: row.playerId, name: `Player #${row.playerId}` };
 
+    // Single spread: the ES doc (or placeholder) is copied once, then overlaid.
     return {
-      ...base,
+      ...(doc ?? { name: `Player #${row.playerId}` }),
       id: row.playerId,
       rank: row.rank,
       rankedScoreRank: row.rank,
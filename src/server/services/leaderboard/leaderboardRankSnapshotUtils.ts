@@ -37,6 +37,14 @@ export function utcNextIsoDateOnly(dateStr: string): string {
   return utcDateOnlyFromDate(dt);
 }
 
+/** Shift a DATEONLY string by `days` calendar days in UTC (negative = earlier). */
+export function utcAddDaysIsoDateOnly(dateStr: string, days: number): string {
+  const { y, m0, d } = parseIsoDateOnly(dateStr);
+  const dt = new Date(Date.UTC(y, m0, d));
+  dt.setUTCDate(dt.getUTCDate() + days);
+  return utcDateOnlyFromDate(dt);
+}
+
 export function utcDateOnlyFromDate(d: Date): string {
   const y = d.getUTCFullYear();
   const mo = String(d.getUTCMonth() + 1).padStart(2, '0');
@@ -44,14 +52,19 @@ export function utcDateOnlyFromDate(d: Date): string {
   return `${y}-${mo}-${day}`;
 }
 
-/** Iterate DATEONLY strings from `from` through `to` inclusive (UTC). */
-export function* iterateUtcDateOnlyRange(from: string, to: string): Generator<string> {
+/** Iterate DATEONLY strings from `from` through `to` inclusive (UTC), every `stepDays` days. */
+export function* iterateUtcDateOnlyRange(
+  from: string,
+  to: string,
+  stepDays = 1,
+): Generator<string> {
   let cur = parseIsoDateOnly(from);
   const end = parseIsoDateOnly(to);
   const curTime = new Date(Date.UTC(cur.y, cur.m0, cur.d)).getTime();
   const endTime = new Date(Date.UTC(end.y, end.m0, end.d)).getTime();
   if (curTime > endTime) return;
-  for (let t = curTime; t <= endTime; t += 86400000) {
+  const stepMs = Math.max(1, Math.floor(stepDays)) * 86400000;
+  for (let t = curTime; t <= endTime; t += stepMs) {
     yield utcDateOnlyFromDate(new Date(t));
   }
 }
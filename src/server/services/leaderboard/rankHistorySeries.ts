@@ -1,7 +1,10 @@
 import { Op } from 'sequelize';
 import { RANK_HISTORY_MAX_POINTS } from '@/config/leaderboardRankHistory.js';
 import PlayerLeaderboardRankEvent from '@/models/players/PlayerLeaderboardRankEvent.js';
-import { iterateUtcDateOnlyRange } from '@/server/services/leaderboard/leaderboardRankSnapshotUtils.js';
+import {
+  iterateUtcDateOnlyRange,
+  utcAddDaysIsoDateOnly,
+} from '@/server/services/leaderboard/leaderboardRankSnapshotUtils.js';
 
 export type RankHistoryPoint = {
   date: string;
@@ -54,18 +57,24 @@ export async function buildRankHistorySeries(options: {
     return [];
   }
 
-  let dayList = [...iterateUtcDateOnlyRange(computedFrom, computedTo)];
-  if (dayList.length === 0) {
-    return [];
-  }
-
+  // Generate only the days we return rather than the full range then filtering/slicing.
+  let dayList: string[];
   if (stepDays > 1) {
-    dayList = dayList.filter((_, i) => i % stepDays === 0);
-    if (dayList[dayList.length - 1] !== computedTo) {
+    dayList = [...iterateUtcDateOnlyRange(computedFrom, computedTo, stepDays)];
+    if (dayList.length > 0 && dayList[dayList.length - 1] !== computedTo) {
       dayList.push(computedTo);
     }
-  } else if (dayList.length > RANK_HISTORY_MAX_POINTS) {
-    dayList = dayList.slice(dayList.length - RANK_HISTORY_MAX_POINTS);
+  } else {
+    const windowStart = utcAddDaysIsoDateOnly(computedTo, -(RANK_HISTORY_MAX_POINTS - 1));
+    dayList = [
+      ...iterateUtcDateOnlyRange(
+        windowStart > computedFrom ? windowStart : computedFrom,
+        computedTo,
+      ),
+    ];
+  }
+  if (dayList.length === 0) {
+    return [];
   }
 
   let ptr = 0;